@@ -19,8 +19,6 @@
 
 """Handling of HTTP cookies."""
 
-import typing
-
 from PyQt5.QtNetwork import QNetworkCookie, QNetworkCookieJar
 from PyQt5.QtCore import pyqtSignal, QDateTime
 
@@ -93,14 +91,17 @@ class CookieJar(RAMCookieJar):
 
     def parse_cookies(self):
         """Parse cookies from lineparser and store them."""
-        cookies = []  # type: typing.Sequence[QNetworkCookie]
-        for line in self._lineparser:
-            line_cookies = QNetworkCookie.parseCookies(line)
-            cookies += line_cookies  # type: ignore[operator]
-        self.setAllCookies(cookies)
+        # The lineparser is opened in binary mode, so we can hand the joined
+        # lines to Qt directly; parseCookies handles each line separately.
+        raw = b'\n'.join(self._lineparser)
+        self.setAllCookies(QNetworkCookie.parseCookies(raw))
 
     def purge_old_cookies(self):
-        """Purge expired cookies from the cookie jar."""
+        """Purge expired cookies from the cookie jar.
+
+        Return:
+            A list of the cookies which were kept.
+        """
         # Based on:
         # http://doc.qt.io/qt-5/qtwebkitexamples-webkitwidgets-browser-cookiejar-cpp.html
         now = QDateTime.currentDateTime()
@@ -108,14 +109,13 @@ class CookieJar(RAMCookieJar):
                    if c.isSessionCookie() or
                    c.expirationDate() >= now]  # type: ignore[operator]
         self.setAllCookies(cookies)
+        return cookies
 
     def save(self):
         """Save cookies to disk."""
-        self.purge_old_cookies()
-        lines = []
-        for cookie in self.allCookies():
-            if not cookie.isSessionCookie():
-                lines.append(cookie.toRawForm())
+        cookies = self.purge_old_cookies()
+        lines = [cookie.toRawForm() for cookie in cookies
+                 if not cookie.isSessionCookie()]
         self._lineparser.data = lines
         self._lineparser.save()
 
@@ -45,6 +45,11 @@ if typing.TYPE_CHECKING:
 
 
 HOSTBLOCK_ERROR_STRING = '%HOSTBLOCK%'
+_HEADER_OPTIONS = {
+    'content.headers.accept_language',
+    'content.headers.custom',
+    'content.headers.do_not_track',
+}
 _proxy_auth_cache = {}  # type: typing.Dict[ProxyId, prompt.AuthInfo]
 
 
@@ -102,6 +107,12 @@ def _is_secure_cipher(cipher):
         return True
 
 
+def _headers_have_patterns():
+    """Check whether any option used for custom headers is set per-URL."""
+    return any(config.instance.has_pattern_values(name)
+               for name in _HEADER_OPTIONS)
+
+
 def init():
     """Disable insecure SSL ciphers on old Qt versions."""
     default_ciphers = QSslSocket.defaultCiphers()
@@ -125,6 +136,7 @@ def init():
 
 _SavedErrorsType = typing.MutableMapping[urlutils.HostTupleType,
                                          typing.Sequence[QSslError]]
+_HeadersType = typing.Sequence[typing.Tuple[bytes, bytes]]
 
 
 class NetworkManager(QNetworkAccessManager):
@@ -146,6 +158,11 @@ class NetworkManager(QNetworkAccessManager):
         _rejected_ssl_errors: A {QUrl: [SslError]} dict of rejected errors.
         _accepted_ssl_errors: A {QUrl: [SslError]} dict of accepted errors.
         _private: Whether we're in private browsing mode.
+        _custom_headers: The cached output of shared.custom_headers, or None
+                         if the headers need to be looked up again.
+        _per_url_headers: Whether the header settings are customized for URL
+                          patterns (or None if unknown). If so, the headers
+                          can't be cached.
         netrc_used: Whether netrc authentication was performed.
 
     Signals:
@@ -182,6 +199,9 @@ class NetworkManager(QNetworkAccessManager):
         self.proxyAuthenticationRequired.connect(  # type: ignore[attr-defined]
             self.on_proxy_authentication_required)
         self.netrc_used = False
+        self._custom_headers = None  # type: typing.Optional[_HeadersType]
+        self._per_url_headers = None  # type: typing.Optional[bool]
+        config.instance.changed.connect(self._on_headers_changed)
 
     def _set_cookiejar(self):
         """Set the cookie jar of the NetworkManager correctly."""
@@ -207,6 +227,26 @@ class NetworkManager(QNetworkAccessManager):
         self.setCache(cache.diskcache)
         cache.diskcache.setParent(app)
 
+    @config.change_filter('content.headers')
+    def _on_headers_changed(self):
+        """Invalidate the cached headers if their settings changed."""
+        self._custom_headers = None
+        self._per_url_headers = None
+
+    def _get_custom_headers(self, url):
+        """Get the custom headers to set for the given URL.
+
+        As long as the settings aren't customized for any URL pattern, the
+        headers are the same for every request, so we only look them up once.
+        """
+        if self._per_url_headers is None:
+            self._per_url_headers = _headers_have_patterns()
+        if self._per_url_headers:
+            return shared.custom_headers(url=url)
+        if self._custom_headers is None:
+            self._custom_headers = shared.custom_headers(url=None)
+        return self._custom_headers
+
     def _get_abort_signals(self, owner=None):
         """Get a list of signals which should abort a question."""
         abort_on = [self.shutting_down]
@@ -358,12 +398,12 @@ class NetworkManager(QNetworkAccessManager):
 
         try:
             if referer_header_conf == 'never':
-                # Note: using ''.encode('ascii') sends a header with no value,
+                # Note: using b'' sends a header with no value,
                 # instead of no header at all
-                req.setRawHeader('Referer'.encode('ascii'), QByteArray())
+                req.setRawHeader(b'Referer', QByteArray())
             elif (referer_header_conf == 'same-domain' and
                   not urlutils.same_domain(req.url(), current_url)):
-                req.setRawHeader('Referer'.encode('ascii'), QByteArray())
+                req.setRawHeader(b'Referer', QByteArray())
             # If refer_header_conf is set to 'always', we leave the header
             # alone as QtWebKit did set it.
         except urlutils.InvalidUrlError:
@@ -396,7 +436,7 @@ class NetworkManager(QNetworkAccessManager):
                     req, proxy_error, QNetworkReply.UnknownProxyError,
                     self)
 
-        for header, value in shared.custom_headers(url=req.url()):
+        for header, value in self._get_custom_headers(req.url()):
             req.setRawHeader(header, value)
 
         # There are some scenarios where we can't figure out current_url:
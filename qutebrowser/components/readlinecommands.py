@@ -31,11 +31,12 @@ class _ReadlineBridge:
     """Bridge which provides readline-like commands for the current QLineEdit.
 
     Attributes:
-        _deleted: Mapping from widgets to their last deleted text.
+        _deleted: The most recently deleted text, shared between all widgets
+                  like readline's kill ring.
     """
 
     def __init__(self) -> None:
-        self._deleted = {}  # type: typing.MutableMapping[QLineEdit, str]
+        self._deleted = ''
 
     def _widget(self) -> typing.Optional[QLineEdit]:
         """Get the currently active QLineEdit."""
@@ -45,6 +46,14 @@ class _ReadlineBridge:
         else:
             return None
 
+    def _store_deleted(self, widget: QLineEdit) -> None:
+        """Remember the selected text of the given widget for yanking."""
+        if widget.echoMode() == QLineEdit.Normal:
+            self._deleted = widget.selectedText()
+        else:
+            # Don't allow yanking e.g. a password into another widget.
+            self._deleted = ''
+
     def _dispatch(self, name: str, *,
                   mark: bool = None,
                   delete: bool = False) -> None:
@@ -59,7 +68,7 @@ class _ReadlineBridge:
             method(mark)
 
         if delete:
-            self._deleted[widget] = widget.selectedText()
+            self._store_deleted(widget)
             widget.del_()
 
     def backward_char(self) -> None:
@@ -108,7 +117,7 @@ class _ReadlineBridge:
 
         moveby = cursor_position - target_position - 1
         widget.cursorBackward(True, moveby)
-        self._deleted[widget] = widget.selectedText()
+        self._store_deleted(widget)
         widget.del_()
 
     def unix_word_rubout(self) -> None:
@@ -126,9 +135,9 @@ class _ReadlineBridge:
     def yank(self) -> None:
         """Paste previously deleted text."""
         widget = self._widget()
-        if widget is None or widget not in self._deleted:
+        if widget is None or not self._deleted:
             return
-        widget.insert(self._deleted[widget])
+        widget.insert(self._deleted)
 
     def delete_char(self) -> None:
         self._dispatch('del_')
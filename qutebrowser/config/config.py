@@ -352,6 +352,12 @@ class Config(QObject):
         """Raise NoOptionError if the given setting does not exist."""
         self.get_opt(name)
 
+    def has_pattern_values(self, name: str) -> bool:
+        """Check whether the given setting is set for any URL pattern."""
+        self.ensure_has_opt(name)
+        return any(scoped.pattern is not None
+                   for scoped in self._values[name])
+
     def get(self,
             name: str,
             url: QUrl = None, *,
@@ -55,9 +55,14 @@ hypothesis.settings.register_profile('ci',
 hypothesis.settings.load_profile('ci' if testutils.ON_CI else 'default')
 
 
-def _apply_platform_markers(config, item):
-    """Apply a skip marker to a given item."""
-    markers = [
+def _get_platform_markers(config):
+    """Get the platform specific markers and their conditions.
+
+    Return:
+        A list of (searched_marker, new_marker_kind, condition, default_reason)
+        tuples.
+    """
+    return [
         ('posix',
          pytest.mark.skipif,
          not utils.is_posix,
@@ -113,6 +118,14 @@ def _apply_platform_markers(config, item):
          "Broken on WebKit 602.1")
     ]
 
+
+def _apply_platform_markers(markers, item):
+    """Apply a skip marker to a given item.
+
+    Args:
+        markers: The platform markers, as returned by _get_platform_markers.
+        item: The pytest item to apply them to.
+    """
     for searched_marker, new_marker_kind, condition, default_reason in markers:
         marker = item.get_closest_marker(searched_marker)
         if not marker or not condition:
@@ -153,6 +166,10 @@ def pytest_collection_modifyitems(config, items):
     """
     remaining_items = []
     deselected_items = []
+    # Evaluating the conditions involves Qt version checks, so we only do
+    # that once rather than for every item.
+    platform_markers = _get_platform_markers(config)
+    test_basedir = pathlib.Path(__file__).parent
 
     for item in items:
         deselected = False
@@ -161,7 +178,6 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker('gui')
 
         if hasattr(item, 'module'):
-            test_basedir = pathlib.Path(__file__).parent
             module_path = pathlib.Path(item.module.__file__)
             module_root_dir = module_path.relative_to(test_basedir).parts[0]
 
@@ -170,7 +186,7 @@ def pytest_collection_modifyitems(config, items):
             if module_root_dir == 'end2end':
                 item.add_marker(pytest.mark.end2end)
 
-        _apply_platform_markers(config, item)
+        _apply_platform_markers(platform_markers, item)
         if list(item.iter_markers('xfail_norun')):
             item.add_marker(pytest.mark.xfail(run=False))
         if list(item.iter_markers('js_prompt')):
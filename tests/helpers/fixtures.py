@@ -39,7 +39,7 @@ import pytest
 import py.path  # pylint: disable=no-name-in-module
 from PyQt5.QtCore import QSize, Qt
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout
-from PyQt5.QtNetwork import QNetworkCookieJar
+from PyQt5.QtNetwork import QNetworkCookieJar, QNetworkAccessManager
 
 import helpers.stubs as stubsmod
 from qutebrowser.config import (config, configdata, configtypes, configexc,
@@ -425,7 +425,6 @@ def unicode_encode_err():
 @pytest.fixture(scope='session')
 def qnam(qapp):
     """Session-wide QNetworkAccessManager."""
-    from PyQt5.QtNetwork import QNetworkAccessManager
     nam = QNetworkAccessManager()
     nam.setNetworkAccessible(QNetworkAccessManager.NotAccessible)
     return nam
@@ -18,15 +18,54 @@
 # along with qutebrowser.  If not, see <http://www.gnu.org/licenses/>.
 
 import pytest
+from PyQt5.QtCore import QUrl
 
+from qutebrowser.browser import shared
 from qutebrowser.browser.webkit.network import networkmanager
 from qutebrowser.browser.webkit import cookies
+from qutebrowser.utils import urlmatch
 
 
 pytestmark = pytest.mark.usefixtures('cookiejar_and_cache')
 
 
-def test_init_with_private_mode(fake_args):
+def test_init_with_private_mode(config_stub, fake_args):
     nam = networkmanager.NetworkManager(win_id=0, tab_id=0, private=True)
     assert isinstance(nam.cookieJar(), cookies.RAMCookieJar)
     assert nam.cache() is None
+
+
+def test_custom_headers_cached(config_stub, fake_args, monkeypatch):
+    calls = []
+    real_custom_headers = shared.custom_headers
+
+    def custom_headers(url):
+        calls.append(url)
+        return real_custom_headers(url=url)
+
+    monkeypatch.setattr(shared, 'custom_headers', custom_headers)
+    nam = networkmanager.NetworkManager(win_id=0, tab_id=0, private=True)
+    url = QUrl('https://example.com/')
+
+    config_stub.val.content.headers.do_not_track = True
+    assert (b'DNT', b'1') in nam._get_custom_headers(url)
+    assert (b'DNT', b'1') in nam._get_custom_headers(url)
+    assert len(calls) == 1
+
+    config_stub.val.content.headers.do_not_track = False
+    assert (b'DNT', b'0') in nam._get_custom_headers(url)
+    assert (b'DNT', b'0') in nam._get_custom_headers(url)
+    assert len(calls) == 2
+
+
+def test_custom_headers_per_url(config_stub, fake_args):
+    nam = networkmanager.NetworkManager(win_id=0, tab_id=0, private=True)
+    config_stub.val.content.headers.do_not_track = True
+    pattern = urlmatch.UrlPattern('https://example.com/*')
+    config_stub.set_obj('content.headers.do_not_track', False,
+                        pattern=pattern)
+
+    headers = nam._get_custom_headers(QUrl('https://example.com/'))
+    assert (b'DNT', b'0') in headers
+    headers = nam._get_custom_headers(QUrl('https://example.org/'))
+    assert (b'DNT', b'1') in headers
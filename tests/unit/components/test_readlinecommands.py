@@ -106,13 +106,19 @@ def _validate_deletion(lineedit, method, text, deleted, rest):
     """
     lineedit.set_aug_text(text)
     method()
-    assert readlinecommands.bridge._deleted[lineedit] == deleted
+    assert readlinecommands.bridge._deleted == deleted
     assert lineedit.aug_text() == rest
     lineedit.clear()
     readlinecommands.rl_yank()
     assert lineedit.aug_text() == deleted + '|'
 
 
+@pytest.fixture(autouse=True)
+def reset_deleted(monkeypatch):
+    """Make sure the kill buffer doesn't leak between tests."""
+    monkeypatch.setattr(readlinecommands.bridge, '_deleted', '')
+
+
 @pytest.fixture
 def lineedit(qtbot, monkeypatch):
     """Fixture providing a LineEdit."""
@@ -299,3 +305,31 @@ def test_rl_yank_no_text(lineedit):
     lineedit.clear()
     readlinecommands.rl_yank()
     assert lineedit.aug_text() == '|'
+
+
+def test_rl_yank_other_widget(lineedit, qtbot, monkeypatch):
+    """Test yanking text which was deleted in another widget."""
+    lineedit.set_aug_text('test |delete this')
+    readlinecommands.rl_kill_line()
+
+    other = LineEdit()
+    qtbot.add_widget(other)
+    monkeypatch.setattr(QApplication.instance(), 'focusWidget',
+                        lambda: other)
+    readlinecommands.rl_yank()
+    assert other.aug_text() == 'delete this|'
+
+
+def test_rl_yank_password(lineedit, qtbot, monkeypatch):
+    """Make sure deleted text in password fields can't be yanked elsewhere."""
+    lineedit.setEchoMode(QLineEdit.Password)
+    lineedit.set_aug_text('secret|')
+    readlinecommands.rl_unix_line_discard()
+    assert lineedit.text() == ''
+
+    other = LineEdit()
+    qtbot.add_widget(other)
+    monkeypatch.setattr(QApplication.instance(), 'focusWidget',
+                        lambda: other)
+    readlinecommands.rl_yank()
+    assert other.aug_text() == '|'
@@ -458,6 +458,7 @@ class TestConfig:
         lambda c: c.get('tabs'),
         lambda c: c.get_obj('tabs'),
         lambda c: c.get_obj_for_pattern('tabs', pattern=None),
+        lambda c: c.has_pattern_values('tabs'),
         lambda c: c.get_mutable_obj('tabs'),
         lambda c: c.get_str('tabs'),
 
@@ -480,6 +481,15 @@ class TestConfig:
         conf.set_obj(name, False, pattern=pattern)
         assert conf.get(name, url=QUrl('https://example.com/')) is False
 
+    def test_has_pattern_values(self, conf):
+        name = 'content.javascript.enabled'
+        conf.set_obj(name, False)
+        assert not conf.has_pattern_values(name)
+
+        pattern = urlmatch.UrlPattern('*://example.com/')
+        conf.set_obj(name, True, pattern=pattern)
+        assert conf.has_pattern_values(name)
+
     @pytest.mark.parametrize('fallback, expected', [
         (True, True),
         (False, usertypes.UNSET)